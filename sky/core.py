@@ -1,8 +1,7 @@
 """SDK functions for cluster/job management."""
 import os
-import shlex
 import typing
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import colorama
 
@@ -367,8 +366,7 @@ def _start(
         idle_minutes_to_autostop = (
             constants.CONTROLLER_IDLE_MINUTES_TO_AUTOSTOP)
 
-    usage_lib.record_cluster_name_for_current_operation(cluster_name)
-
+    # The cluster name is recorded for usage by `backend.provision()`.
     with dag_lib.Dag():
         dummy_task = task_lib.Task().set_resources(handle.launched_resources)
         dummy_task.num_nodes = handle.launched_nodes
@@ -556,6 +554,21 @@ def stop(cluster_name: str, purge: bool = False) -> None:
     backend.teardown(handle, terminate=False, purge=purge)
 
 
+# Maps (is_cancel, down) of autostop() to the operation shown in messages, the
+# option name, and the cloud features required for it.
+_AutostopEntry = Tuple[str, str, Set[clouds.CloudImplementationFeatures]]
+_AUTOSTOP_DISPATCH: Dict[Tuple[bool, bool], _AutostopEntry] = {
+    (True, False): ('Cancelling auto{stop,down}', '{stop,down}', set()),
+    (True, True): ('Cancelling auto{stop,down}', '{stop,down}', set()),
+    (False, False): ('Scheduling autostop', 'stop', {
+        clouds.CloudImplementationFeatures.STOP,
+        clouds.CloudImplementationFeatures.AUTOSTOP
+    }),
+    (False, True): ('Scheduling autodown', 'down',
+                    {clouds.CloudImplementationFeatures.AUTODOWN}),
+}
+
+
 @usage_lib.entrypoint
 def autostop(
         cluster_name: str,
@@ -606,11 +619,8 @@ def autostop(
           user identity.
     """
     is_cancel = idle_minutes < 0
-    verb = 'Cancelling' if is_cancel else 'Scheduling'
-    option_str = 'down' if down else 'stop'
-    if is_cancel:
-        option_str = '{stop,down}'
-    operation = f'{verb} auto{option_str}'
+    operation, option_str, required_features = _AUTOSTOP_DISPATCH[(is_cancel,
+                                                                   bool(down))]
     if controller_utils.Controllers.from_name(cluster_name) is not None:
         raise exceptions.NotSupportedError(
             f'{operation} SkyPilot controller {cluster_name!r} '
@@ -631,19 +641,10 @@ def autostop(
             f'{backend.__class__.__name__!r} is not supported.')
     cloud = handle.launched_resources.cloud
     # Check if autostop/autodown is required and supported
-    if not is_cancel:
+    if required_features:
         try:
-            if down:
-                cloud.check_features_are_supported(
-                    handle.launched_resources,
-                    {clouds.CloudImplementationFeatures.AUTODOWN})
-            else:
-                cloud.check_features_are_supported(
-                    handle.launched_resources,
-                    {clouds.CloudImplementationFeatures.STOP})
-                cloud.check_features_are_supported(
-                    handle.launched_resources,
-                    {clouds.CloudImplementationFeatures.AUTOSTOP})
+            cloud.check_features_are_supported(handle.launched_resources,
+                                               required_features)
         except exceptions.NotSupportedError as e:
             raise exceptions.NotSupportedError(
                 f'{colorama.Fore.YELLOW}{operation} on cluster '
@@ -712,12 +713,14 @@ def queue(cluster_name: str,
                                                            code,
                                                            require_outputs=True,
                                                            separate_stderr=True)
-    subprocess_utils.handle_returncode(
-        returncode,
-        command=code,
-        error_msg=f'Failed to get job queue on cluster {cluster_name}.',
-        stderr=f'{jobs_payload + stderr}',
-        stream_logs=True)
+    if returncode != 0:
+        # Only join the (possibly large) payload with stderr on failure.
+        subprocess_utils.handle_returncode(
+            returncode,
+            command=code,
+            error_msg=f'Failed to get job queue on cluster {cluster_name}.',
+            stderr=jobs_payload + stderr,
+            stream_logs=True)
     jobs = job_lib.load_job_queue(jobs_payload)
     return jobs
 
@@ -967,9 +970,12 @@ def storage_ls() -> List[Dict[str, Any]]:
             }
         ]
     """
-    storages = global_user_state.get_storage()
+    storages = global_user_state.get_storage_summaries()
     for storage in storages:
-        storage['store'] = list(storage.pop('handle').sky_stores.keys())
+        storage['store'] = [
+            data.StoreType(store_type)
+            for store_type in storage.pop('store_types')
+        ]
     return storages
 
 
@@ -1015,11 +1021,11 @@ def realtime_kubernetes_gpu_availability(
         region_filter=context,
         quantity_filter=quantity_filter,
         case_sensitive=False)
-    assert (set(counts.keys()) == set(capacity.keys()) == set(
-        available.keys())), (f'Keys of counts ({list(counts.keys())}), '
-                             f'capacity ({list(capacity.keys())}), '
-                             f'and available ({list(available.keys())}) '
-                             'must be same.')
+    assert counts.keys() == capacity.keys() == available.keys(), (
+        f'Keys of counts ({list(counts.keys())}), '
+        f'capacity ({list(capacity.keys())}), '
+        f'and available ({list(available.keys())}) '
+        'must be same.')
     if len(counts) == 0:
         err_msg = 'No GPUs found in Kubernetes cluster. '
         debug_msg = 'To further debug, run: sky check '
@@ -1038,11 +1044,11 @@ def realtime_kubernetes_gpu_availability(
 
     realtime_gpu_availability_list: List[models.RealtimeGpuAvailability] = []
 
-    for gpu, _ in sorted(counts.items()):
+    for gpu in sorted(counts):
         realtime_gpu_availability_list.append(
             models.RealtimeGpuAvailability(
                 gpu,
-                counts.pop(gpu),
+                counts[gpu],
                 capacity[gpu],
                 available[gpu],
             ))
@@ -1096,12 +1102,7 @@ def local_down() -> None:
     """Tears down the Kubernetes cluster started by local_up."""
     cluster_removed = False
 
-    path_to_package = os.path.dirname(__file__)
-    down_script_path = os.path.join(path_to_package, 'utils/kubernetes',
-                                    'delete_cluster.sh')
-
-    cwd = os.path.dirname(os.path.abspath(down_script_path))
-    run_command = shlex.split(down_script_path)
+    run_command = [kubernetes_deploy_utils.DELETE_LOCAL_SCRIPT_PATH]
 
     # Setup logging paths
     run_timestamp = sky_logging.get_run_timestamp()
@@ -1113,11 +1114,12 @@ def local_down() -> None:
                                      log_path=log_path,
                                      is_local=True)):
 
-        returncode, stdout, stderr = log_lib.run_with_log(cmd=run_command,
-                                                          log_path=log_path,
-                                                          require_outputs=True,
-                                                          stream_logs=False,
-                                                          cwd=cwd)
+        returncode, stdout, stderr = log_lib.run_with_log(
+            cmd=run_command,
+            log_path=log_path,
+            require_outputs=True,
+            stream_logs=False,
+            cwd=kubernetes_deploy_utils.SCRIPTS_DIR)
         stderr = stderr.replace('No kind clusters found.\n', '')
 
         if returncode == 0:
@@ -163,6 +163,11 @@ def create_table(cursor, conn):
 
     db_utils.add_column_to_table(cursor, conn, 'cluster_history', 'user_hash',
                                  'TEXT DEFAULT null')
+
+    # The store types of the storage handle, so that listing storages does
+    # not need to unpickle the handles.
+    db_utils.add_column_to_table(cursor, conn, 'storage', 'store_types',
+                                 'TEXT DEFAULT null')
     conn.commit()
 
 
@@ -560,17 +565,17 @@ def _get_cluster_usage_intervals(
     return None
 
 
-def _get_cluster_launch_time(cluster_hash: str) -> Optional[int]:
-    usage_intervals = _get_cluster_usage_intervals(cluster_hash)
+def _get_launch_time_from_usage_intervals(
+    usage_intervals: Optional[List[Tuple[int,
+                                         Optional[int]]]]) -> Optional[int]:
     if usage_intervals is None:
         return None
     return usage_intervals[0][0]
 
 
-def _get_cluster_duration(cluster_hash: str) -> int:
+def _get_duration_from_usage_intervals(
+        usage_intervals: Optional[List[Tuple[int, Optional[int]]]]) -> int:
     total_duration = 0
-    usage_intervals = _get_cluster_usage_intervals(cluster_hash)
-
     if usage_intervals is None:
         return total_duration
 
@@ -775,15 +780,19 @@ def get_clusters_from_history() -> List[Dict[str, Any]]:
 
         if status is not None:
             status = status_lib.ClusterStatus[status]
+        # The usage intervals are already selected above, so derive the launch
+        # time and duration from them instead of querying the table again.
+        usage_intervals = pickle.loads(usage_intervals)
 
         record = {
             'name': name,
-            'launched_at': _get_cluster_launch_time(cluster_hash),
-            'duration': _get_cluster_duration(cluster_hash),
+            'launched_at':
+                _get_launch_time_from_usage_intervals(usage_intervals),
+            'duration': _get_duration_from_usage_intervals(usage_intervals),
             'num_nodes': num_nodes,
             'resources': pickle.loads(launched_resources),
             'cluster_hash': cluster_hash,
-            'usage_intervals': pickle.loads(usage_intervals),
+            'usage_intervals': usage_intervals,
             'status': status,
             'user_hash': user_hash,
         }
@@ -837,6 +846,10 @@ def _get_capability_key(cloud_capability: 'cloud.CloudCapability') -> str:
     return _ENABLED_CLOUDS_KEY_PREFIX + cloud_capability.value
 
 
+def _get_store_types_str(handle: 'Storage.StorageMetadata') -> str:
+    return json.dumps([store_type.value for store_type in handle.sky_stores])
+
+
 def add_or_update_storage(storage_name: str,
                           storage_handle: 'Storage.StorageMetadata',
                           storage_status: status_lib.StorageStatus):
@@ -850,9 +863,12 @@ def add_or_update_storage(storage_name: str,
     if not status_check(storage_status):
         raise ValueError(f'Error in updating global state. Storage Status '
                          f'{storage_status} is passed in incorrectly')
-    _DB.cursor.execute('INSERT OR REPLACE INTO storage VALUES (?, ?, ?, ?, ?)',
-                       (storage_name, storage_launched_at, handle, last_use,
-                        storage_status.value))
+    _DB.cursor.execute(
+        'INSERT OR REPLACE INTO storage '
+        '(name, launched_at, handle, last_use, status, store_types) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        (storage_name, storage_launched_at, handle, last_use,
+         storage_status.value, _get_store_types_str(storage_handle)))
     _DB.conn.commit()
 
 
@@ -886,10 +902,12 @@ def get_storage_status(storage_name: str) -> Optional[status_lib.StorageStatus]:
 
 def set_storage_handle(storage_name: str,
                        handle: 'Storage.StorageMetadata') -> None:
-    _DB.cursor.execute('UPDATE storage SET handle=(?) WHERE name=(?)', (
-        pickle.dumps(handle),
-        storage_name,
-    ))
+    _DB.cursor.execute(
+        'UPDATE storage SET handle=(?), store_types=(?) WHERE name=(?)', (
+            pickle.dumps(handle),
+            _get_store_types_str(handle),
+            storage_name,
+        ))
     count = _DB.cursor.rowcount
     _DB.conn.commit()
     assert count <= 1, count
@@ -924,7 +942,8 @@ def get_storage_names_start_with(starts_with: str) -> List[str]:
 
 
 def get_storage() -> List[Dict[str, Any]]:
-    rows = _DB.cursor.execute('SELECT * FROM storage')
+    rows = _DB.cursor.execute(
+        'SELECT name, launched_at, handle, last_use, status FROM storage')
     records = []
     for name, launched_at, handle, last_use, status in rows:
         # TODO: use namedtuple instead of dict
@@ -936,3 +955,32 @@ def get_storage() -> List[Dict[str, Any]]:
             'status': status_lib.StorageStatus[status],
         })
     return records
+
+
+def get_storage_summaries() -> List[Dict[str, Any]]:
+    """Returns the storages with their store types instead of handles.
+
+    The store types are read from the store_types column, so the handles are
+    only unpickled for storages added before the column existed.
+    """
+    rows = _DB.cursor.execute('SELECT name, launched_at, last_use, status, '
+                              'store_types FROM storage').fetchall()
+    records = []
+    for name, launched_at, last_use, status, store_types in rows:
+        if store_types is None:
+            handle = get_handle_from_storage_name(name)
+            store_types = ('[]'
+                           if handle is None else _get_store_types_str(handle))
+            # Backfill the column, so the handle is only unpickled once.
+            _DB.cursor.execute(
+                'UPDATE storage SET store_types=(?) '
+                'WHERE name=(?) AND store_types IS NULL', (store_types, name))
+            _DB.conn.commit()
+        records.append({
+            'name': name,
+            'launched_at': launched_at,
+            'store_types': json.loads(store_types),
+            'last_use': last_use,
+            'status': status_lib.StorageStatus[status],
+        })
+    return records
@@ -1,8 +1,6 @@
 """SDK functions for managed jobs."""
-import json
 import typing
 from typing import Dict, List, Optional, Union
-import webbrowser
 
 import click
 
@@ -14,21 +12,35 @@ from sky.server import common as server_common
 from sky.server.requests import payloads
 from sky.skylet import constants
 from sky.usage import usage_lib
+from sky.utils import annotations
 from sky.utils import common_utils
 from sky.utils import dag_utils
 
 if typing.TYPE_CHECKING:
     import io
+    import webbrowser
 
     import requests
 
     import sky
 else:
     requests = adaptors_common.LazyImport('requests')
+    # Only needed by dashboard().
+    webbrowser = adaptors_common.LazyImport('webbrowser')
 
 logger = sky_logging.init_logger(__name__)
 
 
+@annotations.lru_cache(scope='global', maxsize=1)
+def _get_session() -> 'requests.Session':
+    """Returns the session shared by the managed jobs SDK calls.
+
+    Reusing the session keeps the connections to the API server alive across
+    calls, instead of opening a new connection for each request.
+    """
+    return requests.Session()
+
+
 @usage_lib.entrypoint
 @server_common.check_server_healthy_or_start
 def launch(
@@ -78,9 +90,9 @@ def launch(
         task=dag_str,
         name=name,
     )
-    response = requests.post(
+    response = _get_session().post(
         f'{server_common.get_server_url()}/jobs/launch',
-        json=json.loads(body.model_dump_json()),
+        json=body.model_dump(mode='json'),
         timeout=(5, None),
         cookies=server_common.get_api_cookie_jar(),
     )
@@ -135,9 +147,9 @@ def queue(refresh: bool,
         skip_finished=skip_finished,
         all_users=all_users,
     )
-    response = requests.post(
+    response = _get_session().post(
         f'{server_common.get_server_url()}/jobs/queue',
-        json=json.loads(body.model_dump_json()),
+        json=body.model_dump(mode='json'),
         timeout=(5, None),
         cookies=server_common.get_api_cookie_jar(),
     )
@@ -175,9 +187,9 @@ def cancel(
         all=all,
         all_users=all_users,
     )
-    response = requests.post(
+    response = _get_session().post(
         f'{server_common.get_server_url()}/jobs/cancel',
-        json=json.loads(body.model_dump_json()),
+        json=body.model_dump(mode='json'),
         timeout=(5, None),
         cookies=server_common.get_api_cookie_jar(),
     )
@@ -222,9 +234,9 @@ def tail_logs(name: Optional[str] = None,
         controller=controller,
         refresh=refresh,
     )
-    response = requests.post(
+    response = _get_session().post(
         f'{server_common.get_server_url()}/jobs/logs',
-        json=json.loads(body.model_dump_json()),
+        json=body.model_dump(mode='json'),
         stream=True,
         timeout=(5, None),
         cookies=server_common.get_api_cookie_jar(),
@@ -267,9 +279,9 @@ def download_logs(
         controller=controller,
         local_dir=local_dir,
     )
-    response = requests.post(
+    response = _get_session().post(
         f'{server_common.get_server_url()}/jobs/download_logs',
-        json=json.loads(body.model_dump_json()),
+        json=body.model_dump(mode='json'),
         timeout=(5, None),
         cookies=server_common.get_api_cookie_jar(),
     )
@@ -1045,6 +1045,14 @@ class Resources:
     def get_cost(self, seconds: float) -> float:
         """Returns cost in USD for the runtime in seconds."""
         hours = seconds / 3600
+        return self.get_hourly_cost() * hours
+
+    # Cached to avoid repeated catalog lookups when the same resources are
+    # costed for different durations, e.g., by the optimizer and when printing
+    # its plan. Request-scoped so that catalog updates are picked up.
+    @annotations.lru_cache(scope='request', maxsize=1024)
+    def get_hourly_cost(self) -> float:
+        """Returns the hourly cost in USD of one node."""
         # Instance.
         hourly_cost = self.cloud.instance_type_to_hourly_cost(
             self._instance_type, self.use_spot, self._region, self._zone)
@@ -1052,7 +1060,7 @@ class Resources:
         if self.accelerators is not None:
             hourly_cost += self.cloud.accelerators_to_hourly_cost(
                 self.accelerators, self.use_spot, self._region, self._zone)
-        return hourly_cost * hours
+        return hourly_cost
 
     def get_accelerators_str(self) -> str:
         accelerators = self.accelerators
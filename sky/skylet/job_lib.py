@@ -791,10 +791,16 @@ def load_job_queue(payload: str) -> List[Dict[str, Any]]:
         payload: The encoded payload string to load.
     """
     jobs = message_utils.decode_payload(payload)
+    # A queue usually has many jobs from few users, so look up each user name
+    # only once instead of querying the user table for every job.
+    user_names: Dict[str, Optional[str]] = {}
     for job in jobs:
         job['status'] = JobStatus(job['status'])
-        job['user_hash'] = job['username']
-        job['username'] = global_user_state.get_user(job['user_hash']).name
+        user_hash = job['username']
+        if user_hash not in user_names:
+            user_names[user_hash] = global_user_state.get_user(user_hash).name
+        job['user_hash'] = user_hash
+        job['username'] = user_names[user_hash]
     return jobs
 
 
@@ -849,6 +855,9 @@ def cancel_jobs_encoded_results(jobs: Optional[List[int]],
         job_records.extend(_get_jobs_by_ids(jobs))
 
     cancelled_ids = []
+    # Created lazily and shared across jobs, as connecting to the job server
+    # is only needed for jobs submitted with ray job submit.
+    job_client = None
     # Sequentially cancel the jobs to avoid the resource number bug caused by
     # ray cluster (tracked in #1262).
     for job_record in job_records:
@@ -884,7 +893,8 @@ def cancel_jobs_encoded_results(jobs: Optional[List[int]],
                 try:
                     # TODO(zhwu): Backward compatibility, remove after 0.9.0.
                     # The job was submitted with ray job submit before #4318.
-                    job_client = _create_ray_job_submission_client()
+                    if job_client is None:
+                        job_client = _create_ray_job_submission_client()
                     job_client.stop_job(_make_ray_job_id(job['job_id']))
                 except RuntimeError as e:
                     # If the request to the job server fails, we should not
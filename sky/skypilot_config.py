@@ -22,8 +22,8 @@ To set a value in the nested-key config:
 
   >> config_dict = skypilot_config.set_nested(('auth', 'some_key'), value)
 
-This operation returns a deep-copy dict, and is safe in that any key not found
-will not raise an error.
+This operation returns a copied dict that shares the unchanged parts with the
+loaded config, and is safe in that any key not found will not raise an error.
 
 Example usage:
 
@@ -59,6 +59,7 @@ from sky import exceptions
 from sky import sky_logging
 from sky.adaptors import common as adaptors_common
 from sky.skylet import constants
+from sky.utils import annotations
 from sky.utils import common_utils
 from sky.utils import config_utils
 from sky.utils import schemas
@@ -156,11 +157,19 @@ def get_nested(keys: Tuple[str, ...],
 
 
 def set_nested(keys: Tuple[str, ...], value: Any) -> Dict[str, Any]:
-    """Returns a deep-copied config with the nested key set to value.
+    """Returns a copied config with the nested key set to value.
+
+    Only the top-level section of 'keys' is copied, and the rest of the config
+    is shared with the loaded config. The returned dict should not be modified
+    in-place; deep-copy it first if needed.
 
     Like get_nested(), if any key is not found, this will not raise an error.
     """
-    copied_dict = copy.deepcopy(_dict)
+    copied_dict = config_utils.Config(_dict)
+    if keys and keys[0] in copied_dict:
+        # The section may be merged with 'value' in-place, e.g. lists in
+        # kubernetes configs, so it is copied entirely.
+        copied_dict[keys[0]] = copy.deepcopy(copied_dict[keys[0]])
     copied_dict.set_nested(keys, value)
     return dict(**copied_dict)
 
@@ -217,14 +226,25 @@ def _reload_config() -> None:
 
 
 def _parse_config_file(config_path: str) -> config_utils.Config:
-    config = config_utils.Config()
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config_str = f.read()
+    # The config is reloaded many times per process with the same file
+    # content, so the parsed config is cached on the content. The cached
+    # config is copied, as the caller may modify it. Parse errors are not
+    # cached, so they are logged on every reload.
     try:
-        config_dict = common_utils.read_yaml(config_path)
-        config = config_utils.Config.from_dict(config_dict)
-        logger.debug(
-            f'Config loaded from {config_path}:\n{pprint.pformat(config)}')
+        config = _parse_config_str(config_path, config_str)
     except yaml.YAMLError as e:
         logger.error(f'Error in loading config file ({config_path}):', e)
+        return config_utils.Config()
+    return copy.deepcopy(config)
+
+
+@annotations.lru_cache(scope='global', maxsize=16)
+def _parse_config_str(config_path: str, config_str: str) -> config_utils.Config:
+    config_dict = common_utils.read_yaml_str(config_str)
+    config = config_utils.Config.from_dict(config_dict)
+    logger.debug(f'Config loaded from {config_path}:\n{pprint.pformat(config)}')
     if config:
         _validate_config(config, config_path)
 
@@ -298,12 +318,10 @@ def _reload_config_hierarchical() -> None:
     # load the user config file
     if os.path.exists(user_config_path):
         user_config = _parse_config_file(user_config_path)
-        _validate_config(user_config, user_config_path)
         overrides.append(user_config)
 
     if os.path.exists(project_config_path):
         project_config = _parse_config_file(project_config_path)
-        _validate_config(project_config, project_config_path)
         overrides.append(project_config)
 
     # layer the configs on top of each other based on priority
@@ -323,6 +341,18 @@ def loaded_config_path() -> Optional[str]:
     return _loaded_config_path
 
 
+def reload_config() -> None:
+    """Reloads the config from the config files.
+
+    This is cheaper than importlib.reload() on this module, which also
+    re-imports the module's dependencies and re-creates its globals.
+    """
+    global _config_overridden
+    # The config is read from the files again, so it is no longer overridden.
+    _config_overridden = False
+    _reload_config()
+
+
 # Load on import.
 _reload_config()
 
@@ -344,10 +374,10 @@ def override_skypilot_config(
         yield
         return
     original_config = _dict
-    config = _dict.get_nested(
-        keys=tuple(),
-        default_value=None,
-        override_configs=override_configs,
+    # The sections that are not overridden are shared with the original
+    # config, which is fine as _dict is never modified in-place.
+    config = _dict.overlay(
+        override_configs,
         allowed_override_keys=None,
         disallowed_override_keys=constants.SKIPPED_CLIENT_OVERRIDE_KEYS)
     try:
@@ -1,8 +1,10 @@
 """Accelerator registry."""
+import re
 import typing
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from sky.clouds import service_catalog
+from sky.utils import annotations
 from sky.utils import rich_utils
 from sky.utils import ux_utils
 
@@ -47,10 +49,29 @@ _SCHEDULABLE_NON_GPU_ACCELERATORS = [
 
 def is_schedulable_non_gpu_accelerator(accelerator_name: str) -> bool:
     """Returns if this accelerator is a 'schedulable' non-GPU accelerator."""
-    for name in _SCHEDULABLE_NON_GPU_ACCELERATORS:
-        if name in accelerator_name.lower():
-            return True
-    return False
+    accelerator_name = accelerator_name.lower()
+    return any(
+        name in accelerator_name for name in _SCHEDULABLE_NON_GPU_ACCELERATORS)
+
+
+@annotations.lru_cache(scope='global', maxsize=1)
+def _get_accelerators() -> Tuple[Tuple[str, str], ...]:
+    """Returns the (canonical name, clouds) pairs in the catalog.
+
+    The pairs are read out of the catalog data frame once, so that searching
+    for a name does not build a new data frame for every lookup.
+    """
+    return tuple((name, clouds) for name, clouds in _accelerator_df[
+        ['AcceleratorName', 'Clouds']].values)
+
+
+@annotations.lru_cache(scope='global', maxsize=1)
+def _get_canonical_names_by_lower() -> Dict[str, str]:
+    """Returns a mapping from lowercase to canonical accelerator names."""
+    names_by_lower: Dict[str, str] = {}
+    for name, _ in _get_accelerators():
+        names_by_lower.setdefault(name.lower(), name)
+    return names_by_lower
 
 
 def canonicalize_accelerator_name(accelerator: str,
@@ -65,12 +86,15 @@ def canonicalize_accelerator_name(accelerator: str,
         return accelerator.lower()
 
     # Common case: do not read the catalog files.
-    df = _accelerator_df[_accelerator_df['AcceleratorName'].str.contains(
-        accelerator, case=False, regex=True)]
+    # Exact match (case ignored) does not need to scan the data frame.
+    name = _get_canonical_names_by_lower().get(accelerator.lower())
+    if name is not None:
+        return name
+    pattern = re.compile(accelerator, re.IGNORECASE)
     names = []
-    for name, clouds in df[['AcceleratorName', 'Clouds']].values:
-        if accelerator.lower() == name.lower():
-            return name
+    for name, clouds in _get_accelerators():
+        if not pattern.search(name):
+            continue
         if cloud_str is None or cloud_str in clouds:
             names.append(name)
 
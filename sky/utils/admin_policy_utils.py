@@ -140,7 +140,7 @@ def apply(
             # TODO(zhwu): This is not a clean way to update the SkyPilot config,
             # because we are resetting the global context for a single DAG,
             # which is conceptually weird.
-            importlib.reload(skypilot_config)
+            skypilot_config.reload_config()
 
     logger.debug(f'Mutated user request: {mutated_user_request}')
     mutated_dag.policy_applied = True
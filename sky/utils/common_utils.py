@@ -47,6 +47,9 @@ CLUSTER_NAME_HASH_LENGTH = 2
 
 _COLOR_PATTERN = re.compile(r'\x1b[^m]*m')
 
+# Lazy initialized, to avoid importing yaml at module import.
+_yaml_safe_loader = None
+
 _VALID_ENV_VAR_REGEX = '[a-zA-Z_][a-zA-Z0-9_]*'
 
 logger = sky_logging.init_logger(__name__)
@@ -96,7 +99,14 @@ def get_user_hash() -> str:
     if _is_valid_user_hash(user_hash):
         assert user_hash is not None
         return user_hash
+    return _get_or_create_user_hash_file()
+
 
+# The env var above can be set differently for each request on the API
+# server, so only the file lookup is cached.
+@annotations.lru_cache(scope='request')
+def _get_or_create_user_hash_file() -> str:
+    """Returns the user hash cached in the file, creating it if needed."""
     if os.path.exists(_USER_HASH_FILE):
         # Read from cached user hash file.
         with open(_USER_HASH_FILE, 'r', encoding='utf-8') as f:
@@ -356,17 +366,33 @@ def user_and_hostname_hash() -> str:
     return f'{getpass.getuser()}-{hostname_hash}'
 
 
+def _get_yaml_safe_loader() -> Any:
+    """Returns the libyaml-based safe loader if available.
+
+    The C loader parses much faster than the pure Python yaml.SafeLoader, and
+    constructs the same objects.
+    """
+    global _yaml_safe_loader
+    if _yaml_safe_loader is None:
+        _yaml_safe_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return _yaml_safe_loader
+
+
 def read_yaml(path: Optional[str]) -> Dict[str, Any]:
     if path is None:
         raise ValueError('Attempted to read a None YAML.')
     with open(path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_get_yaml_safe_loader())
     return config
 
 
+def read_yaml_str(yaml_str: str) -> Dict[str, Any]:
+    return yaml.load(yaml_str, Loader=_get_yaml_safe_loader())
+
+
 def read_yaml_all_str(yaml_str: str) -> List[Dict[str, Any]]:
     stream = io.StringIO(yaml_str)
-    config = yaml.safe_load_all(stream)
+    config = yaml.load_all(stream, Loader=_get_yaml_safe_loader())
     configs = list(config)
     if not configs:
         # Empty YAML file.
@@ -6,6 +6,8 @@ from sky import sky_logging
 
 logger = sky_logging.init_logger(__name__)
 
+_NOT_FOUND = object()
+
 
 class Config(Dict[str, Any]):
     """SkyPilot config that supports setting/getting values with nested keys."""
@@ -36,11 +38,16 @@ class Config(Dict[str, Any]):
         Returns:
             The value of the nested key, or 'default_value' if not found.
         """
+        if override_configs is None:
+            # Only the found value is copied, instead of the whole config.
+            value = _get_nested(self, keys, _NOT_FOUND, pop=False)
+            if value is _NOT_FOUND:
+                return default_value
+            return copy.deepcopy(value)
         config = copy.deepcopy(self)
-        if override_configs is not None:
-            config = _recursive_update(config, override_configs,
-                                       allowed_override_keys,
-                                       disallowed_override_keys)
+        config = _recursive_update(config, override_configs,
+                                   allowed_override_keys,
+                                   disallowed_override_keys)
         return _get_nested(config, keys, default_value, pop=False)
 
     def set_nested(self, keys: Tuple[str, ...], value: Any) -> None:
@@ -57,6 +64,26 @@ class Config(Dict[str, Any]):
                 override = {key: override}
         _recursive_update(self, override)
 
+    def overlay(
+        self,
+        override_configs: Dict[str, Any],
+        allowed_override_keys: Optional[List[Tuple[str, ...]]] = None,
+        disallowed_override_keys: Optional[List[Tuple[str, ...]]] = None
+    ) -> 'Config':
+        """Returns a new config with override_configs applied on top.
+
+        Only the top-level sections in 'override_configs' are copied, and the
+        other sections are shared with this config, so the returned config
+        should not be modified in-place.
+        """
+        config = Config(self)
+        for key in override_configs:
+            if key in config:
+                config[key] = copy.deepcopy(config[key])
+        return _recursive_update(config, override_configs,
+                                 allowed_override_keys,
+                                 disallowed_override_keys)
+
     def pop_nested(self, keys: Tuple[str, ...], default_value: Any) -> Any:
         """Pops a nested key."""
         return _get_nested(self, keys, default_value, pop=True)
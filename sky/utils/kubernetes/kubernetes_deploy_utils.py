@@ -1,7 +1,8 @@
 """Utility functions for deploying Kubernetes clusters."""
+import concurrent.futures
+import json
 import os
 import shlex
-import subprocess
 import tempfile
 from typing import List, Optional
 
@@ -19,6 +20,13 @@ from sky.utils import ux_utils
 
 logger = sky_logging.init_logger(__name__)
 
+# The deployment scripts are run from the directory they are in.
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEPLOY_REMOTE_SCRIPT_PATH = os.path.join(SCRIPTS_DIR,
+                                          'deploy_remote_cluster.sh')
+_CREATE_LOCAL_SCRIPT_PATH = os.path.join(SCRIPTS_DIR, 'create_cluster.sh')
+DELETE_LOCAL_SCRIPT_PATH = os.path.join(SCRIPTS_DIR, 'delete_cluster.sh')
+
 
 def deploy_remote_cluster(ip_list: List[str],
                           ssh_user: str,
@@ -27,10 +35,6 @@ def deploy_remote_cluster(ip_list: List[str],
                           context_name: Optional[str] = None,
                           password: Optional[str] = None):
     success = False
-    path_to_package = os.path.dirname(__file__)
-    up_script_path = os.path.join(path_to_package, 'deploy_remote_cluster.sh')
-    # Get directory of script and run it from there
-    cwd = os.path.dirname(os.path.abspath(up_script_path))
 
     # Create temporary files for the IPs and SSH key
     with tempfile.NamedTemporaryFile(mode='w') as ip_file, \
@@ -44,7 +48,7 @@ def deploy_remote_cluster(ip_list: List[str],
         key_file.flush()
         os.chmod(key_file.name, 0o600)
 
-        deploy_command = (f'{up_script_path} {ip_file.name} '
+        deploy_command = (f'{_DEPLOY_REMOTE_SCRIPT_PATH} {ip_file.name} '
                           f'{ssh_user} {key_file.name}')
         if context_name is not None:
             deploy_command += f' {context_name}'
@@ -76,7 +80,7 @@ def deploy_remote_cluster(ip_list: List[str],
                 stream_logs=False,
                 line_processor=log_utils.SkyRemoteUpLineProcessor(
                     log_path=log_path, is_local=True),
-                cwd=cwd)
+                cwd=SCRIPTS_DIR)
         if returncode == 0:
             success = True
         else:
@@ -120,13 +124,9 @@ def deploy_local_cluster(gpus: bool):
     message_str = 'Creating local cluster{}...'
     message_str = message_str.format((' with GPU support (this may take up '
                                       'to 15 minutes)') if gpus else '')
-    path_to_package = os.path.dirname(__file__)
-    up_script_path = os.path.join(path_to_package, 'create_cluster.sh')
-
-    # Get directory of script and run it from there
-    cwd = os.path.dirname(os.path.abspath(up_script_path))
-    run_command = up_script_path + ' --gpus' if gpus else up_script_path
-    run_command = shlex.split(run_command)
+    run_command = [_CREATE_LOCAL_SCRIPT_PATH]
+    if gpus:
+        run_command.append('--gpus')
 
     # Setup logging paths
     run_timestamp = sky_logging.get_run_timestamp()
@@ -145,7 +145,7 @@ def deploy_local_cluster(gpus: bool):
             stream_logs=False,
             line_processor=log_utils.SkyLocalUpLineProcessor(log_path=log_path,
                                                              is_local=True),
-            cwd=cwd)
+            cwd=SCRIPTS_DIR)
 
     # Kind always writes to stderr even if it succeeds.
     # If the failure happens after the cluster is created, we need
@@ -169,51 +169,46 @@ def deploy_local_cluster(gpus: bool):
             raise RuntimeError('Failed to create local cluster. '
                                f'Full log: {log_hint}'
                                f'\nError: {stderr}')
-    # Run sky check
-    with rich_utils.safe_status('[bold cyan]Running sky check...'):
-        sky_check.check_capability(sky_cloud.CloudCapability.COMPUTE,
-                                   quiet=True,
-                                   clouds=['kubernetes'])
-    if cluster_created:
-        # Prepare completion message which shows CPU and GPU count
-        # Get number of CPUs
-        p = subprocess_utils.run(
-            'kubectl get nodes -o jsonpath=\'{.items[0].status.capacity.cpu}\'',
-            capture_output=True)
-        num_cpus = int(p.stdout.decode('utf-8'))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        nodes_future = None
+        if cluster_created:
+            # Fetch all the nodes once for the completion message, which shows
+            # the CPU and GPU count. This does not depend on sky check, so run
+            # it while sky check probes the cluster.
+            nodes_future = executor.submit(subprocess_utils.run,
+                                           'kubectl get nodes -o json',
+                                           capture_output=True)
+        # Run sky check
+        with rich_utils.safe_status('[bold cyan]Running sky check...'):
+            sky_check.check_capability(sky_cloud.CloudCapability.COMPUTE,
+                                       quiet=True,
+                                       clouds=['kubernetes'])
+    if nodes_future is not None:
+        # Read the CPU count, GPU type and GPU count from the nodes, instead
+        # of querying the API server for each of them.
+        p = nodes_future.result()
+        nodes = json.loads(p.stdout)['items']
+        num_cpus = int(nodes[0]['status']['capacity']['cpu'])
 
         # GPU count/type parsing
         gpu_message = ''
         gpu_hint = ''
         if gpus:
-            # Get GPU model by querying the node labels
-            label_name_escaped = 'skypilot.co/accelerator'.replace('.', '\\.')
-            gpu_type_cmd = f'kubectl get node skypilot-control-plane -o jsonpath=\"{{.metadata.labels[\'{label_name_escaped}\']}}\"'  # pylint: disable=line-too-long
-            try:
-                # Run the command and capture the output
-                gpu_count_output = subprocess.check_output(gpu_type_cmd,
-                                                           shell=True,
-                                                           text=True)
-                gpu_type_str = gpu_count_output.strip() + ' '
-            except subprocess.CalledProcessError as e:
-                output = str(e.output.decode('utf-8'))
-                logger.warning(f'Failed to get GPU type: {output}')
-                gpu_type_str = ''
+            # Get GPU model from the labels of the control plane node
+            gpu_type_str = ''
+            for node in nodes:
+                if node['metadata']['name'] == 'skypilot-control-plane':
+                    gpu_type = node['metadata'].get('labels', {}).get(
+                        kubernetes_utils.SkyPilotLabelFormatter.LABEL_KEY)
+                    if gpu_type:
+                        gpu_type_str = gpu_type + ' '
+                    break
 
             # Get number of GPUs (sum of nvidia.com/gpu resources)
-            gpu_count_command = 'kubectl get nodes -o=jsonpath=\'{range .items[*]}{.status.allocatable.nvidia\\.com/gpu}{\"\\n\"}{end}\' | awk \'{sum += $1} END {print sum}\''  # pylint: disable=line-too-long
-            try:
-                # Run the command and capture the output
-                gpu_count_output = subprocess.check_output(gpu_count_command,
-                                                           shell=True,
-                                                           text=True)
-                gpu_count = gpu_count_output.strip(
-                )  # Remove any extra whitespace
-                gpu_message = f' and {gpu_count} {gpu_type_str}GPUs'
-            except subprocess.CalledProcessError as e:
-                output = str(e.output.decode('utf-8'))
-                logger.warning(f'Failed to get GPU count: {output}')
-                gpu_message = f' with {gpu_type_str}GPU support'
+            gpu_count = sum(
+                int(node['status'].get('allocatable', {}).get(
+                    'nvidia.com/gpu', 0)) for node in nodes)
+            gpu_message = f' and {gpu_count} {gpu_type_str}GPUs'
 
             gpu_hint = (
                 '\nHint: To see the list of GPUs in the cluster, '
@@ -131,6 +131,13 @@ def mock_client_requests(monkeypatch: pytest.MonkeyPatch, mock_queue,
     # Use monkeypatch to replace `requests.post` and `requests.get`
     monkeypatch.setattr(requests, "post", mock_post)
     monkeypatch.setattr(requests, "get", mock_get)
+    # Also mock the requests made through a shared `requests.Session`
+    monkeypatch.setattr(
+        requests.Session, "post",
+        lambda self, url, *args, **kwargs: mock_post(url, *args, **kwargs))
+    monkeypatch.setattr(
+        requests.Session, "get",
+        lambda self, url, *args, **kwargs: mock_get(url, *args, **kwargs))
 
 
 @pytest.fixture
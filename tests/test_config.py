@@ -1,5 +1,4 @@
 """Test skypilot_config"""
-import copy
 import os
 import pathlib
 import textwrap
@@ -24,6 +23,7 @@ PORT_FORWARD_MODE_NAME = kubernetes_enums.KubernetesNetworkingMode.PORTFORWARD.v
 RUN_DURATION = 30
 RUN_DURATION_OVERRIDE = 10
 PROVISION_TIMEOUT = 600
+_GENERATED_DIR = os.path.expanduser('~/.sky/generated')
 
 
 def _reload_config() -> None:
@@ -42,89 +42,102 @@ def _check_empty_config() -> None:
                                       'default') == 'default'
 
 
-def _create_config_file(config_file_path: pathlib.Path) -> None:
-    config_file_path.write_text(
-        textwrap.dedent(f"""\
-            aws:
-                vpc_name: {VPC_NAME}
-                use_internal_ips: true
-                ssh_proxy_command: {PROXY_COMMAND}
-                disk_encrypted: {DISK_ENCRYPTED}
-
+_CONFIG_YAML = textwrap.dedent(f"""\
+    aws:
+        vpc_name: {VPC_NAME}
+        use_internal_ips: true
+        ssh_proxy_command: {PROXY_COMMAND}
+        disk_encrypted: {DISK_ENCRYPTED}
+
+    gcp:
+        vpc_name: {VPC_NAME}
+        use_internal_ips: true
+        managed_instance_group:
+            run_duration: {RUN_DURATION}
+            provision_timeout: {PROVISION_TIMEOUT}
+
+    kubernetes:
+        networking: {NODEPORT_MODE_NAME}
+        pod_config:
+            spec:
+                metadata:
+                    annotations:
+                        my_annotation: my_value
+                runtimeClassName: nvidia    # Custom runtimeClassName for GPU pods.
+                imagePullSecrets:
+                    - name: my-secret     # Pull images from a private registry using a secret
+
+    """)
+
+_TASK_YAML = textwrap.dedent(f"""\
+    experimental:
+        config_overrides:
+            docker:
+                run_options:
+                    - -v /tmp:/tmp
+            kubernetes:
+                pod_config:
+                    metadata:
+                        labels:
+                            test-key: test-value
+                        annotations:
+                            abc: def
+                    spec:
+                        imagePullSecrets:
+                            - name: my-secret-2
+                provision_timeout: 100
             gcp:
-                vpc_name: {VPC_NAME}
-                use_internal_ips: true
                 managed_instance_group:
-                    run_duration: {RUN_DURATION}
-                    provision_timeout: {PROVISION_TIMEOUT}
-
+                    run_duration: {RUN_DURATION_OVERRIDE}
+            nvidia_gpus:
+                disable_ecc: true
+    resources:
+        image_id: docker:ubuntu:latest
+
+    setup: echo 'Setting up...'
+    run: echo 'Running...'
+    """)
+
+_INVALID_CONFIG_YAML = textwrap.dedent("""\
+    experimental:
+        config_overrides:
             kubernetes:
-                networking: {NODEPORT_MODE_NAME}
                 pod_config:
+                    metadata:
+                        labels:
+                            test-key: test-value
+                        annotations:
+                            abc: def
                     spec:
-                        metadata:
-                            annotations:
-                                my_annotation: my_value
-                        runtimeClassName: nvidia    # Custom runtimeClassName for GPU pods.
+                        containers:
+                            - name:
                         imagePullSecrets:
-                            - name: my-secret     # Pull images from a private registry using a secret
+                            - name: my-secret-2
 
-            """))
+    setup: echo 'Setting up...'
+    run: echo 'Running...'
+    """)
 
 
-def _create_task_yaml_file(task_file_path: pathlib.Path) -> None:
-    task_file_path.write_text(
-        textwrap.dedent(f"""\
-        experimental:
-            config_overrides:
-                docker:
-                    run_options:
-                        - -v /tmp:/tmp
-                kubernetes:
-                    pod_config:
-                        metadata:
-                            labels:
-                                test-key: test-value
-                            annotations:
-                                abc: def
-                        spec:
-                            imagePullSecrets:
-                                - name: my-secret-2
-                    provision_timeout: 100
-                gcp:
-                    managed_instance_group:
-                        run_duration: {RUN_DURATION_OVERRIDE}
-                nvidia_gpus:
-                    disable_ecc: true
-        resources:
-            image_id: docker:ubuntu:latest
+@pytest.fixture(scope='session')
+def sample_config_path(tmp_path_factory) -> pathlib.Path:
+    config_path = tmp_path_factory.mktemp('config') / 'config.yaml'
+    config_path.write_text(_CONFIG_YAML)
+    return config_path
 
-        setup: echo 'Setting up...'
-        run: echo 'Running...'
-        """))
 
+@pytest.fixture(scope='session')
+def sample_task_path(tmp_path_factory) -> pathlib.Path:
+    task_path = tmp_path_factory.mktemp('task') / 'task.yaml'
+    task_path.write_text(_TASK_YAML)
+    return task_path
 
-def _create_invalid_config_yaml_file(task_file_path: pathlib.Path) -> None:
-    task_file_path.write_text(
-        textwrap.dedent("""\
-        experimental:
-            config_overrides:
-                kubernetes:
-                    pod_config:
-                        metadata:
-                            labels:
-                                test-key: test-value
-                            annotations:
-                                abc: def
-                        spec:
-                            containers:
-                                - name:
-                            imagePullSecrets:
-                                - name: my-secret-2
 
-        setup: echo 'Setting up...'
-        run: echo 'Running...'
-        """))
+@pytest.fixture(scope='session')
+def sample_invalid_task_path(tmp_path_factory) -> pathlib.Path:
+    task_path = tmp_path_factory.mktemp('invalid_task') / 'task.yaml'
+    task_path.write_text(_INVALID_CONFIG_YAML)
+    return task_path
 
 
 def test_nested_config(monkeypatch) -> None:
@@ -165,6 +178,21 @@ def test_empty_config(monkeypatch, tmp_path) -> None:
     _check_empty_config()
 
 
+def test_malformed_yaml_config_logged_on_every_reload(monkeypatch,
+                                                      tmp_path) -> None:
+    """Test that a malformed config is reported each time it is reloaded."""
+    config_path = tmp_path / 'malformed.yaml'
+    config_path.write_text('aws: [\n')
+    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH', config_path)
+    monkeypatch.setattr(skypilot_config, '_PROJECT_CONFIG_PATH',
+                        tmp_path / 'nonexistent.yaml')
+    with mock.patch.object(skypilot_config.logger, 'error') as mock_error:
+        skypilot_config._reload_config()
+        skypilot_config._reload_config()
+    assert mock_error.call_count == 2
+    _check_empty_config()
+
+
 def test_valid_null_proxy_config(monkeypatch, tmp_path) -> None:
     """Test that the config is not loaded if the config file is empty."""
     with open(tmp_path / 'valid.yaml', 'w', encoding='utf-8') as f:
@@ -191,27 +219,14 @@ def test_valid_null_proxy_config(monkeypatch, tmp_path) -> None:
     assert proxy_config is None, proxy_config
 
 
-def test_invalid_field_config(monkeypatch, tmp_path) -> None:
-    """Test that the config is not loaded if the config file contains unknown field."""
-    config_path = tmp_path / 'invalid.yaml'
-    config_path.open('w', encoding='utf-8').write(
-        textwrap.dedent(f"""\
+@pytest.mark.parametrize('config_yaml', [
+    pytest.param(textwrap.dedent(f"""\
         aws:
             vpc_name: {VPC_NAME}
             not_a_field: 123
-        """))
-    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
-                        tmp_path / 'invalid.yaml')
-    with pytest.raises(ValueError) as e:
-        skypilot_config._reload_config()
-    assert 'Invalid config YAML' in e.value.args[0]
-
-
-def test_invalid_indent_config(monkeypatch, tmp_path) -> None:
-    """Test that the config is not loaded if the config file is incorrectly indented."""
-    config_path = tmp_path / 'invalid.yaml'
-    config_path.open('w', encoding='utf-8').write(
-        textwrap.dedent(f"""\
+        """),
+                 id='unknown-field'),
+    pytest.param(textwrap.dedent("""\
         jobs:
             controller:
                 resources:
@@ -219,26 +234,21 @@ def test_invalid_indent_config(monkeypatch, tmp_path) -> None:
                 instance_type: n2-standard-4
                 cpus: 4
                 disk_size: 50
-        """))
-    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
-                        tmp_path / 'invalid.yaml')
-    with pytest.raises(ValueError) as e:
-        skypilot_config._reload_config()
-    assert 'Invalid config YAML' in e.value.args[0]
-
-
-def test_invalid_enum_config(monkeypatch, tmp_path) -> None:
-    """Test that the config is not loaded if the config file contains an invalid enum value."""
-    config_path = tmp_path / 'invalid.yaml'
-    config_path.open('w', encoding='utf-8').write(
-        textwrap.dedent(f"""\
+        """),
+                 id='bad-indent'),
+    pytest.param(textwrap.dedent("""\
         jobs:
             controller:
                 resources:
                     cloud: notacloud
-        """))
-    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
-                        tmp_path / 'invalid.yaml')
+        """),
+                 id='bad-enum'),
+])
+def test_invalid_config(monkeypatch, tmp_path, config_yaml) -> None:
+    """Test that the config is not loaded if the config file is invalid."""
+    config_path = tmp_path / 'invalid.yaml'
+    config_path.write_text(config_yaml, encoding='utf-8')
+    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH', config_path)
     with pytest.raises(ValueError) as e:
         skypilot_config._reload_config()
     assert 'Invalid config YAML' in e.value.args[0]
@@ -296,13 +306,13 @@ def test_valid_num_items_config(monkeypatch, tmp_path) -> None:
     skypilot_config._reload_config()
 
 
-def test_config_get_set_nested(monkeypatch, tmp_path) -> None:
+def test_config_get_set_nested(monkeypatch, tmp_path,
+                               sample_config_path) -> None:
     """Test that set_nested(), get_nested() works."""
 
     # Load from a config file
-    config_path = tmp_path / 'config.yaml'
-    _create_config_file(config_path)
-    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH', config_path)
+    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
+                        sample_config_path)
     skypilot_config._reload_config()
     # Check that the config is loaded with the expected values
     assert skypilot_config.loaded()
@@ -338,7 +348,11 @@ def test_config_get_set_nested(monkeypatch, tmp_path) -> None:
     assert skypilot_config.get_nested(('gcp', 'use_internal_ips'), None)
 
     # Check config with only partial keys still works
-    new_config3 = copy.copy(new_config2)
+    # Copy the sections so that deleting keys does not modify new_config2.
+    new_config3 = {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in new_config2.items()
+    }
     del new_config3['aws']['ssh_proxy_command']
     del new_config3['aws']['use_internal_ips']
     new_config_path = tmp_path / 'new_config3.yaml'
@@ -357,11 +371,25 @@ def test_config_get_set_nested(monkeypatch, tmp_path) -> None:
         ('aws', 'ssh_proxy_command'), None) is None
 
 
-def test_config_with_env(monkeypatch, tmp_path) -> None:
+def test_set_nested_does_not_modify_loaded_list(monkeypatch,
+                                                sample_config_path) -> None:
+    """Test that set_nested() on a list value keeps the loaded config."""
+    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
+                        sample_config_path)
+    skypilot_config._reload_config()
+    keys = ('kubernetes', 'pod_config', 'spec', 'imagePullSecrets')
+    new_config = skypilot_config.set_nested(keys, [{'name': 'new-secret'}])
+    assert new_config['kubernetes']['pod_config']['spec'][
+        'imagePullSecrets'] == [{
+            'name': 'new-secret'
+        }]
+    assert skypilot_config.get_nested(keys, None) == [{'name': 'my-secret'}]
+
+
+def test_config_with_env(monkeypatch, tmp_path, sample_config_path) -> None:
     """Test that the config is loaded with environment variables."""
-    config_path = tmp_path / 'config.yaml'
-    _create_config_file(config_path)
-    monkeypatch.setenv(skypilot_config.ENV_VAR_SKYPILOT_CONFIG, config_path)
+    monkeypatch.setenv(skypilot_config.ENV_VAR_SKYPILOT_CONFIG,
+                       sample_config_path)
     monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
                         tmp_path / 'does_not_exist')
     skypilot_config._reload_config()
@@ -383,16 +411,13 @@ def test_invalid_override_config(monkeypatch, tmp_path) -> None:
             pass
 
 
-def test_k8s_config_with_override(monkeypatch, tmp_path,
-                                  enable_all_clouds) -> None:
-    config_path = tmp_path / 'config.yaml'
-    _create_config_file(config_path)
-    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH', config_path)
+def test_k8s_config_with_override(monkeypatch, tmp_path, enable_all_clouds,
+                                  sample_config_path, sample_task_path) -> None:
+    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
+                        sample_config_path)
 
     skypilot_config._reload_config()
-    task_path = tmp_path / 'task.yaml'
-    _create_task_yaml_file(task_path)
-    task = sky.Task.from_yaml(task_path)
+    task = sky.Task.from_yaml(sample_task_path)
 
     # Test Kubernetes overrides
     # Get cluster YAML
@@ -400,9 +425,9 @@ def test_k8s_config_with_override(monkeypatch, tmp_path,
     task.set_resources_override({'cloud': sky.Kubernetes()})
     request_id = sky.launch(task, cluster_name=cluster_name, dryrun=True)
     sky.stream_and_get(request_id)
-    cluster_yaml = pathlib.Path(
-        f'~/.sky/generated/{cluster_name}.yml.tmp').expanduser().rename(
-            tmp_path / (cluster_name + '.yml'))
+    cluster_yaml = str(tmp_path / f'{cluster_name}.yml')
+    os.replace(os.path.join(_GENERATED_DIR, f'{cluster_name}.yml.tmp'),
+               cluster_yaml)
 
     # Load the cluster YAML
     cluster_config = common_utils.read_yaml(cluster_yaml)
@@ -419,15 +444,13 @@ def test_k8s_config_with_override(monkeypatch, tmp_path,
 
 
 def test_k8s_config_with_invalid_config(monkeypatch, tmp_path,
-                                        enable_all_clouds) -> None:
-    config_path = tmp_path / 'config.yaml'
-    _create_config_file(config_path)
-    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH', config_path)
+                                        enable_all_clouds, sample_config_path,
+                                        sample_invalid_task_path) -> None:
+    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
+                        sample_config_path)
 
     _reload_config()
-    task_path = tmp_path / 'task.yaml'
-    _create_invalid_config_yaml_file(task_path)
-    task = sky.Task.from_yaml(task_path)
+    task = sky.Task.from_yaml(sample_invalid_task_path)
 
     # Test Kubernetes pod_config invalid
     cluster_name = 'test_k8s_config_with_invalid_config'
@@ -441,25 +464,22 @@ def test_k8s_config_with_invalid_config(monkeypatch, tmp_path,
     assert exception_occurred
 
 
-def test_gcp_config_with_override(monkeypatch, tmp_path,
-                                  enable_all_clouds) -> None:
-    config_path = tmp_path / 'config.yaml'
-    _create_config_file(config_path)
-    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH', config_path)
+def test_gcp_config_with_override(monkeypatch, tmp_path, enable_all_clouds,
+                                  sample_config_path, sample_task_path) -> None:
+    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
+                        sample_config_path)
 
     skypilot_config._reload_config()
-    task_path = tmp_path / 'task.yaml'
-    _create_task_yaml_file(task_path)
-    task = sky.Task.from_yaml(task_path)
+    task = sky.Task.from_yaml(sample_task_path)
 
     # Test GCP overrides
     cluster_name = 'test-gcp-config-with-override'
     task.set_resources_override({'cloud': sky.GCP(), 'accelerators': 'L4'})
     request_id = sky.launch(task, cluster_name=cluster_name, dryrun=True)
     sky.stream_and_get(request_id)
-    cluster_yaml = pathlib.Path(
-        f'~/.sky/generated/{cluster_name}.yml.tmp').expanduser().rename(
-            tmp_path / (cluster_name + '.yml'))
+    cluster_yaml = str(tmp_path / f'{cluster_name}.yml')
+    os.replace(os.path.join(_GENERATED_DIR, f'{cluster_name}.yml.tmp'),
+               cluster_yaml)
 
     # Load the cluster YAML
     cluster_config = common_utils.read_yaml(cluster_yaml)
@@ -477,11 +497,10 @@ def test_gcp_config_with_override(monkeypatch, tmp_path,
         'provision_timeout'] == PROVISION_TIMEOUT
 
 
-def test_config_with_invalid_override(monkeypatch, tmp_path,
-                                      enable_all_clouds) -> None:
-    config_path = tmp_path / 'config.yaml'
-    _create_config_file(config_path)
-    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH', config_path)
+def test_config_with_invalid_override(monkeypatch, tmp_path, enable_all_clouds,
+                                      sample_config_path) -> None:
+    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
+                        sample_config_path)
 
     skypilot_config._reload_config()
 
@@ -541,13 +560,11 @@ def test_get_override_skypilot_config_from_client(mock_to_dict, mock_logger):
             'side or contact your administrator.')
 
 
-def test_override_skypilot_config(monkeypatch, tmp_path):
+def test_override_skypilot_config(monkeypatch, tmp_path, sample_config_path):
     """Test that override_skypilot_config properly restores config and cleans up."""
     os.environ.pop(skypilot_config.ENV_VAR_SKYPILOT_CONFIG, None)
-    # Create original config file
-    config_path = tmp_path / 'config.yaml'
-    _create_config_file(config_path)
-    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH', config_path)
+    monkeypatch.setattr(skypilot_config, '_USER_CONFIG_PATH',
+                        sample_config_path)
     skypilot_config._reload_config()
 
     # Store original values
@@ -1,8 +1,13 @@
+import pickle
 import sys
 
 import pytest
 
 import sky
+from sky import global_user_state
+from sky.data import storage as storage_lib
+from sky.utils import db_utils
+from sky.utils import status_lib
 
 
 @pytest.mark.skipif(sys.platform != 'linux', reason='Only test in CI.')
@@ -10,3 +15,33 @@ def test_enabled_clouds_empty():
     # In test environment, no cloud should be enabled.
     assert sky.global_user_state.get_cached_enabled_clouds(
         sky.clouds.cloud.CloudCapability.COMPUTE) == []
+
+
+def test_get_storage_summaries_with_legacy_rows(tmp_path, monkeypatch):
+    """Test that storages added before the store_types column are listed."""
+    db_conn = db_utils.SQLiteConn(str(tmp_path / 'state.db'),
+                                  global_user_state.create_table)
+    monkeypatch.setattr(global_user_state, '_DB', db_conn)
+    store_types = [storage_lib.StoreType.S3, storage_lib.StoreType.GCS]
+    for i in range(3):
+        handle = storage_lib.Storage.StorageMetadata(
+            storage_name=f'storage-{i}',
+            source=None,
+            sky_stores={store_types[i % 2]: None})
+        db_conn.cursor.execute(
+            'INSERT INTO storage (name, launched_at, handle, last_use, status) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (f'storage-{i}', i, pickle.dumps(handle), 'sky storage ls',
+             status_lib.StorageStatus.READY.value))
+    db_conn.conn.commit()
+
+    for _ in range(2):
+        # The second listing reads the backfilled store_types column.
+        summaries = global_user_state.get_storage_summaries()
+        assert [s['name'] for s in summaries
+               ] == ['storage-0', 'storage-1', 'storage-2']
+        assert [s['store_types'] for s in summaries] == [['S3'], ['GCS'],
+                                                         ['S3']]
+        assert all(
+            s['status'] == status_lib.StorageStatus.READY for s in summaries)
+    assert len(global_user_state.get_storage()) == 3
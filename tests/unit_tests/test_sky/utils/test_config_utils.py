@@ -370,3 +370,33 @@ def test_nested_config_override_with_nonexistent_key():
                                     default_value=None,
                                     override_configs=override_config)
     assert result == override_config['kubernetes']['pod_config']
+
+
+def test_config_overlay():
+    """Test that overlay() does not modify the original config."""
+    config = config_utils.Config({
+        'aws': {
+            'vpc_name': 'base-vpc',
+            'use_internal_ips': True
+        },
+        'gcp': {
+            'project_id': 'base-project'
+        }
+    })
+    new_config = config.overlay({'aws': {'vpc_name': 'override-vpc'}})
+    assert new_config == {
+        'aws': {
+            'vpc_name': 'override-vpc',
+            'use_internal_ips': True
+        },
+        'gcp': {
+            'project_id': 'base-project'
+        }
+    }
+    assert config['aws']['vpc_name'] == 'base-vpc'
+
+    override_configs = {'aws': {'vpc_name': 'override-vpc'}}
+    with pytest.raises(ValueError):
+        config.overlay(override_configs,
+                       disallowed_override_keys=[('aws', 'vpc_name')])
+    assert config['aws']['vpc_name'] == 'base-vpc'